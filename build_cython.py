@@ -0,0 +1,35 @@
+"""
+Optional build step for the Cython CUSUM kernel used by `CumSumFilter`:
+
+    python build_cython.py build_ext --inplace
+
+This places the compiled `_cusum_cy` module next to the sources in `src/`.
+It only builds the extension in place; the repository is not an installable
+package. The utilities work without it.
+"""
+import sys
+
+import numpy as np
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+# -fno-finite-math-only keeps NaN comparisons exact: leading NaN log-returns
+# must reset the sums as in the other scan paths
+extra_compile_args = [] if sys.platform == 'win32' else [
+    '-O3', '-ffast-math', '-fno-finite-math-only', '-march=native',
+]
+
+extensions = [
+    Extension(
+        '_cusum_cy',
+        ['src/_cusum_cy.pyx'],
+        include_dirs=[np.get_include()],
+        define_macros=[('NPY_NO_DEPRECATED_API', 'NPY_1_7_API_VERSION')],
+        extra_compile_args=extra_compile_args,
+    )
+]
+
+setup(
+    package_dir={'': 'src'},
+    ext_modules=cythonize(extensions),
+)
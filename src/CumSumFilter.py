@@ -1,6 +1,121 @@
 import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # pure-Python fallback
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+try:  # optional compiled extension, see build_cython.py
+    try:  # imported as part of the `src` package
+        from ._cusum_cy import cusum_filter as _cusum_cython
+    except ImportError:  # `src/` itself on sys.path
+        from _cusum_cy import cusum_filter as _cusum_cython
+    _HAS_CYTHON = True
+except ImportError:
+    _HAS_CYTHON = False
+
+# Block length of the vectorized NumPy scan, and the chunk length scanned
+# sequentially after each reset: the scan stays sequential while events keep
+# arriving within a chunk and goes back to (doubling) vectorized windows after
+# an event-free one.
+_BLOCK_SIZE = 65536
+_SEQ_WINDOW = 256
+# Relative rounding bound of the closed-form sums, per sample of a window
+_TIE_TOL = 4 * np.finfo(np.float64).eps
+
+
+def _running_extremes(x):
+    """Running sum of `x` along its last axis with its running min and max."""
+    c = np.cumsum(x, axis=-1)
+    return c, np.minimum.accumulate(c, axis=-1), np.maximum.accumulate(c, axis=-1)
+
+
+def _settle(x, s, pre, tol):
+    """
+    Sequential value of a one-sided (upper) CUSUM sum after scanning `x` from `s`.
+
+    `pre` holds the closed-form pre-clamp sums ``s[j - 1] + x[j]``. Where one is
+    below ``-tol`` the sequential sum is certainly reset to zero, so only the
+    samples after the last such reset are summed, with ``np.cumsum``: it adds in
+    order, rounding exactly as the sequential scan does. Resets the closed form
+    cannot decide are found on those exact sums.
+    """
+    reset = np.flatnonzero(pre < -tol)
+    if reset.shape[0]:
+        s = 0.0
+        x = x[reset[-1] + 1:]
+    while x.shape[0]:
+        acc = np.cumsum(np.concatenate(([s], x)))[1:]
+        clamped = acc <= 0.0
+        i = np.argmax(clamped)
+        if not clamped[i]:
+            return float(acc[-1])
+        s = 0.0
+        x = x[i + 1:]
+    return s
+
+
+def _illegal_type(log_returns):
+    return ValueError(
+        "log returns must be a numeric 1-D array-like (NumPy array, list, "
+        "Pandas Series or single-column DataFrame); "
+        f"got {type(log_returns)}"
+    )
+
+
+def _scan_sequential(values, h, s_plus, s_minus):
+    """
+    Plain Python CUSUM scan of the list `values`, starting from the given sums.
+
+    Returns the event offsets within `values` and the final sums.
+    """
+    events = []
+    for i, v in enumerate(values):
+        s_plus = s_plus + v
+        s_plus = s_plus if s_plus > 0.0 else 0.0
+        s_minus = s_minus + v
+        s_minus = s_minus if s_minus < 0.0 else 0.0
+        if s_plus >= h or s_minus <= -h:
+            events.append(i)
+            s_plus, s_minus = 0.0, 0.0
+    return events, s_plus, s_minus
+
+
+@njit(cache=True)
+def _cusum_kernel(data, h):
+    """
+    Sequential CUSUM scan over a contiguous float64 array.
+
+    Returns the integer positions at which either cumulative sum crosses `h`.
+    """
+    out = np.empty(data.shape[0], dtype=np.int64)
+    k = 0
+    s_plus, s_minus = 0.0, 0.0
+
+    for i in range(data.shape[0]):
+        v = data[i]
+        # Branch-free update: the clamps compile to selects and the reset is
+        # a multiply by the trigger mask, so noisy returns cost no mispredicts.
+        s_plus = s_plus + v
+        s_plus = s_plus if s_plus > 0.0 else 0.0
+        s_minus = s_minus + v
+        s_minus = s_minus if s_minus < 0.0 else 0.0
+
+        trig = (s_plus >= h) | (s_minus <= -h)
+        out[k] = i
+        k += trig
+        s_plus *= 1 - trig
+        s_minus *= 1 - trig
+
+    # copy so the n-length scratch buffer is not kept alive by the result
+    return out[:k].copy()
+
+
 class CumSumFilter:
     """
     Cumulative Sum (CUSUM) filter for event-based sampling of time series.
@@ -14,72 +129,156 @@ class CumSumFilter:
         """
         Parameters
         ----------
-        log_returns : np.ndarray, pd.Series, or single-column pd.DataFrame
-            Input log-returns to filter.
+        log_returns : array-like, pd.Series, or single-column pd.DataFrame
+            Input log-returns to filter. A single-column 2-D array is
+            flattened; the index of a Series/DataFrame is kept.
         h : float
             Threshold for cumulative sum to trigger an event.
         """
-        if not isinstance(log_returns, (np.ndarray, pd.Series, pd.DataFrame)):
-            illegal_type = type(log_returns)
-            raise ValueError(
-                f"log returns must be NumPy array, Pandas Series or single-column DataFrame; got {illegal_type}"
-            )
-
-        if isinstance(log_returns, pd.Series):
-            self._index = log_returns.index
-            self._data = log_returns.values.ravel()
+        index = getattr(log_returns, 'index', None)
+        self._index = index if isinstance(index, pd.Index) else None
 
-        elif isinstance(log_returns, pd.DataFrame):
-            if log_returns.shape[1] != 1:
-                raise ValueError("log_returns DataFrame must have exactly one column")
-            self._index = log_returns.index
-            self._data = log_returns.values.ravel()
+        data = np.asarray(log_returns)
+        if data.ndim == 0:
+            raise _illegal_type(log_returns)
+        if data.ndim == 2:
+            if data.shape[1] != 1:
+                raise ValueError("log_returns must have exactly one column")
+            data = data.ravel()
+        elif data.ndim > 2:
+            raise ValueError(f"log_returns must be one-dimensional; got {data.ndim} dimensions")
 
-        else:  # np.ndarray
-            self._data = log_returns.ravel()
+        # contiguous float64 up front, so neither scan path copies on entry
+        try:
+            self._data = np.ascontiguousarray(data, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise _illegal_type(log_returns) from None
 
         self._h = h
-        self._events = []
+        self._events = np.empty(0, dtype=np.int64)
+        self._filtered_events_cache = None
 
     def filter(self):
         """
         Run the CUSUM filter.
 
+        Uses a compiled Numba kernel when Numba is installed, otherwise the
+        Cython kernel if it was built (see ``build_cython.py``), otherwise a
+        vectorized NumPy block scan.
+
         Returns
         -------
-        list of int
+        np.ndarray of int64
             Indices of detected events.
         """
-        s_plus, s_minus = 0, 0
-        self._events = []
+        if _HAS_NUMBA:
+            self._events = _cusum_kernel(self._data, float(self._h))
+        elif _HAS_CYTHON:
+            self._events = _cusum_cython(self._data, float(self._h))
+        else:
+            self._events = self._filter_numpy()
+        self._filtered_events_cache = None
+        return self._events
+
+    def _filter_numpy(self):
+        """
+        CUSUM scan without Numba: vectorized over quiet stretches, sequential
+        where events are dense.
 
-        for i, v in enumerate(self._data):
-            s_plus = max(0, s_plus + v)
-            s_minus = min(0, s_minus + v)
+        Running sums, minima and maxima of blocks of `_BLOCK_SIZE` samples are
+        computed in one vectorized pass. Given the sums carried in from the
+        previous window, both are closed-form within a window:
+        ``s_plus = c - min(cummin(c), -s_plus)`` and
+        ``s_minus = c - max(cummax(c), -s_minus)``, so an event-free window
+        costs a few array operations. The closed form rounds differently from
+        the sequential sums, so it only proposes candidates: from the first
+        sample within rounding distance of a trigger, or a NaN return (which
+        resets both sums as in the sequential scan), samples are scanned
+        sequentially, and the sums carried past the event-free prefix are
+        recomputed exactly with `_settle`. Sequential stretches run in plain
+        Python chunks of `_SEQ_WINDOW`, where a handful of samples is cheaper
+        than a round of NumPy calls; once a chunk passes without an event the
+        scan returns to vectorized windows that double in length up to the end
+        of the block.
+        """
+        data = self._data
+        h = self._h
+        n = data.shape[0]
+        out = np.empty(n, dtype=np.int64)
+        k = 0
 
-            if s_plus >= self._h:
-                self._events.append(i)
-                s_plus, s_minus = 0, 0
+        n_full = n - n % _BLOCK_SIZE
+        c_all, lo_all, hi_all = _running_extremes(data[:n_full].reshape(-1, _BLOCK_SIZE))
+        blocks = list(zip(c_all, lo_all, hi_all))
+        if n_full < n:
+            blocks.append(_running_extremes(data[n_full:]))
 
-            if abs(s_minus) >= self._h:
-                self._events.append(i)
-                s_plus, s_minus = 0, 0
+        s_plus, s_minus = 0.0, 0.0
+        for b, window in enumerate(blocks):
+            start = b * _BLOCK_SIZE
+            stop = min(start + _BLOCK_SIZE, n)
+            width = _BLOCK_SIZE
+            dense = False
+            while start < stop:
+                if dense:
+                    end = min(start + _SEQ_WINDOW, stop)
+                    events, s_plus, s_minus = _scan_sequential(
+                        data[start:end].tolist(), h, s_plus, s_minus
+                    )
+                    for i in events:
+                        out[k] = start + i
+                        k += 1
+                    start = end
+                    dense = bool(events)
+                    width = 2 * _SEQ_WINDOW
+                else:
+                    c, lo, hi = window
+                    m = c.shape[0]
+                    floor_plus = np.minimum(lo, -s_plus)
+                    floor_minus = np.maximum(hi, -s_minus)
+                    tol = _TIE_TOL * (m + 1) * (np.fmax.reduce(np.abs(c)) + s_plus - s_minus + h)
+                    # anything within rounding of a trigger, and NaN resets, is
+                    # left to the sequential scan
+                    candidate = (
+                        (c - floor_plus >= h - tol)
+                        | (c - floor_minus <= tol - h)
+                        | np.isnan(c)
+                    )
+                    i = np.argmax(candidate)
+                    end = i if candidate[i] else m
+                    if end:
+                        x = data[start:start + end]
+                        # pre-clamp sums s[j - 1] + x[j]
+                        pre_plus = c[:end] - np.concatenate(([-s_plus], floor_plus[:end - 1]))
+                        pre_minus = c[:end] - np.concatenate(([-s_minus], floor_minus[:end - 1]))
+                        s_plus = _settle(x, s_plus, pre_plus, tol)
+                        s_minus = -_settle(-x, -s_minus, -pre_minus, tol)
+                    start += end
+                    if candidate[i]:
+                        dense = True
+                    else:
+                        width *= 2
+                if not dense and start < stop:
+                    window = _running_extremes(data[start:min(start + width, stop)])
 
-        return self._events
+        # copy so the n-length scratch buffer is not kept alive by the result
+        return out[:k].copy()
 
     @property
     def filtered_events(self):
         """Return the values of log-returns at detected event indices."""
-        return self._data[self._events]
+        if self._filtered_events_cache is None:
+            self._filtered_events_cache = self._data[self._events]
+        return self._filtered_events_cache
 
     @property
     def events_index(self):
-        """Return integer indices of detected events."""
+        """Return integer indices of detected events as an int64 array."""
         return self._events
 
     @property
     def index(self):
         """Return original index if input was a Series/DataFrame."""
-        if not hasattr(self, '_index'):
+        if self._index is None:
             raise KeyError('No index was found')
         return self._index
@@ -2,6 +2,125 @@ import pandas as pd
 import numpy as np
 import warnings
 
+try:
+    from numba import njit, prange, get_num_threads
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+try:
+    import numexpr as ne
+    _HAS_NUMEXPR = True
+except ImportError:
+    _HAS_NUMEXPR = False
+
+# below this many elements numexpr's dispatch overhead outweighs its fusion
+_NUMEXPR_MIN_SIZE = 100_000
+
+# precisions the compiled kernel supports; others (float16, longdouble) use NumPy
+_KERNEL_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def _use_numexpr(a):
+    return _HAS_NUMEXPR and a.size >= _NUMEXPR_MIN_SIZE
+
+
+def _float_dtype(a):
+    """Floating dtype results of `a` are computed in (float64 for integer input)."""
+    return a.dtype if np.issubdtype(a.dtype, np.floating) else np.dtype(np.float64)
+
+
+def _log_space(method):
+    """Validate a cumulative-returns `method` and return whether it is 'logsum'."""
+    if method not in ('logsum', 'cumprod'):
+        raise ValueError("method must be 'logsum' or 'cumprod'")
+    return method == 'logsum'
+
+
+def _warning_ignored(category):
+    """
+    True if a warning of `category` raised from this module would be
+    discarded by the active filters, so its message need not be formatted.
+    Filters that match on message text or line number are not resolved: an
+    'ignore' one is skipped (NumPy installs a few at import), any other
+    counts as not ignored.
+    """
+    for action, message, filter_category, module, lineno in warnings.filters:
+        if not issubclass(category, filter_category):
+            continue
+        if module is not None and not module.match(__name__):
+            continue
+        if message is not None or lineno:
+            if action == 'ignore':
+                continue
+            return False
+        return action == 'ignore'
+    return False
+
+
+# fastmath without 'nnan'/'ninf' and NumPy error model: price gaps and zero
+# prices must yield NaN/inf exactly as in the NumPy path instead of raising
+@njit(parallel=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'},
+      error_model='numpy', cache=True)
+def _etf_fit(prices, w, log_space, n_chunks):
+    """
+    Single pass over `prices` producing asset returns, cumulative asset
+    returns, ETF returns and cumulative ETF returns (the latter two in the
+    dtype of `w`). With `log_space` the cumulative series are accumulated
+    as ``exp(cumsum(log1p(r)))``.
+
+    Assets are split into `n_chunks` contiguous column ranges processed in
+    parallel, row by row; each chunk keeps its own partial ETF returns,
+    which are summed afterwards.
+    """
+    T, N = prices.shape
+    n = max(T - 1, 0)
+    returns = np.empty((n, N), dtype=prices.dtype)
+    cum_returns = np.empty((n, N), dtype=prices.dtype)
+    etf_returns = np.empty(n, dtype=w.dtype)
+    etf_cum = np.empty(n, dtype=w.dtype)
+    log_cum = np.zeros(N)
+    partial = np.zeros((n_chunks, n))
+
+    for c in prange(n_chunks):
+        lo = c * N // n_chunks
+        hi = (c + 1) * N // n_chunks
+        for t in range(1, T):
+            acc = 0.0
+            for j in range(lo, hi):
+                p0 = prices[t - 1, j]
+                r = prices[t, j] / p0 - 1.0 if p0 != 0.0 else np.nan
+                returns[t - 1, j] = r
+                if log_space:
+                    log_cum[j] += np.log1p(r)
+                    cum_returns[t - 1, j] = np.exp(log_cum[j])
+                else:
+                    prev = cum_returns[t - 2, j] if t > 1 else 1.0
+                    cum_returns[t - 1, j] = prev * (1.0 + r)
+                acc += r * w[j]
+            partial[c, t - 1] = acc
+
+    etf_prev = 1.0
+    etf_log = 0.0
+    for t in range(n):
+        acc = 0.0
+        for c in range(n_chunks):
+            acc += partial[c, t]
+        etf_returns[t] = acc
+        if log_space:
+            etf_log += np.log1p(acc)
+            etf_cum[t] = np.exp(etf_log)
+        else:
+            etf_prev *= 1.0 + acc
+            etf_cum[t] = etf_prev
+
+    return returns, cum_returns, etf_returns, etf_cum
+
+
 class ETFTrick:
     """
     A utility class to transform a weighted basket of assets into a "virtual ETF"
@@ -15,9 +134,13 @@ class ETFTrick:
         Portfolio weights of length N. Can be normalized automatically.
     normalize_weights : bool, default=True
         If True, normalize weights to sum to 1 when they do not.
+    dtype : {np.float32, np.float64}, optional
+        If given, prices and weights are cast to this dtype (``np.float32``
+        halves the memory traffic of large price matrices). By default the
+        input precision is kept.
     """
 
-    def __init__(self, prices, weights, normalize_weights=True):
+    def __init__(self, prices, weights, normalize_weights=True, dtype=None):
         
         self._prices_type = type(prices)
         if not isinstance (prices, (np.ndarray, pd.DataFrame)):
@@ -38,37 +161,165 @@ class ETFTrick:
         if not self._weights.shape[0] == self._prices.shape[-1]:
             raise ValueError("Weights and prices shapes does not match")
 
+        if dtype is not None:
+            if np.dtype(dtype) not in _KERNEL_DTYPES:
+                raise ValueError("dtype must be np.float32 or np.float64")
+            self._prices = np.ascontiguousarray(self._prices, dtype=dtype)
+            self._weights = np.ascontiguousarray(self._weights, dtype=dtype)
+
         total_weights = self._weights.sum()
         if not np.isclose(total_weights, 1.0):
             if normalize_weights:
                 self._weights = self._weights / total_weights
-                warnings.warn(
-                    f"Weights normalized (sum was {total_weights:.4f}). "
-                    f"New weights: {np.array2string(self._weights, precision=4, separator=', ', threshold=10)}",
-                    UserWarning
-                )
+                if not _warning_ignored(UserWarning):
+                    warnings.warn(
+                        f"Weights normalized (sum was {total_weights:.4f}). "
+                        f"New weights: {np.array2string(self._weights, precision=4, separator=', ', threshold=10)}",
+                        UserWarning
+                    )
             else:
                 warnings.warn(
                     f"Sum of weights is {total_weights:.4f} (not 1.0)", UserWarning
                 )
         
 
-    def fit(self):
+    def fit(self, method='cumprod'):
         """
         Compute asset returns, ETF returns, and cumulative ETF returns
         based on the provided prices and weights.
+
+        With Numba installed all four series are computed in one fused pass
+        over the price matrix, parallel across assets; otherwise NumPy ufuncs
+        are used, with numexpr evaluating the element-wise expressions on
+        large inputs if available. Returns over a zero previous price (halts,
+        bad ticks) are NaN rather than inf.
+
+        Parameters
+        ----------
+        method : {'cumprod', 'logsum'}, default='cumprod'
+            How cumulative returns are accumulated. 'cumprod' computes
+            ``cumprod(1 + r)``; on the NumPy path this matches the previous
+            results exactly, while the Numba kernel may differ in the last few
+            digits because it reassociates the weighted ETF sum. 'logsum'
+            computes ``exp(cumsum(log1p(r)))``, which avoids drift over long
+            horizons but is slower and only valid while every return,
+            including the ETF return, is above -1; leveraged or short baskets
+            can break this and turn the rest of the series into NaN.
         """
-        self._returns = (self._prices[1:] / self._prices[:-1]) - 1
+        log_space = _log_space(method)
+
+        # ETF series follow the usual NumPy promotion of returns and weights
+        # (they share one dtype anyway when `dtype` was given)
+        price_dtype = _float_dtype(self._prices)
+        etf_dtype = np.result_type(price_dtype, self._weights.dtype)
+
+        if _HAS_NUMBA and price_dtype in _KERNEL_DTYPES and etf_dtype in _KERNEL_DTYPES:
+            prices = np.ascontiguousarray(self._prices, dtype=price_dtype)
+            weights = np.ascontiguousarray(self._weights, dtype=etf_dtype)
+            n_chunks = max(1, min(prices.shape[1], get_num_threads()))
+            (self._returns, self._cumulative_returns,
+             self._etf_returns, self._etf_cumulative_returns) = _etf_fit(
+                prices, weights, log_space, n_chunks)
+        else:
+            returns = self._simple_returns(self._prices)
+            self._returns = returns
+
+            self._cumulative_returns = self._accumulate(returns, log_space)
+
+            weights = np.ascontiguousarray(self._weights, dtype=etf_dtype)
+            self._etf_returns = np.empty(returns.shape[0], dtype=etf_dtype)
+            np.matmul(returns, weights, out=self._etf_returns)
+            self._etf_cumulative_returns = self._accumulate(self._etf_returns, log_space)
+
         if self._prices_type == pd.DataFrame:
-            self._cumulative_returns = (pd.DataFrame(
-                index = self._index[1:],
-                columns = self._columns_names,
-                data = self._returns
-            ) + 1).cumprod().values
+            self._skip_nan_cumulative_returns(log_space)
+
+    def _skip_nan_cumulative_returns(self, log_space):
+        """
+        Match ``DataFrame.cumprod`` for DataFrame input: a missing return stays
+        NaN at its own position but does not break the cumulative series.
+        """
+        missing = np.isnan(self._returns)
+        if missing.any():
+            cumulative = self._accumulate(np.where(missing, 0.0, self._returns), log_space)
+            cumulative[missing] = np.nan
+            self._cumulative_returns = cumulative
+
+    @staticmethod
+    def fit_many(prices, weights, method='cumprod'):
+        """
+        Batched ETF returns for K independent price windows, e.g. the
+        rebalancing windows of a walk-forward back-test, in one vectorized call.
+
+        Parameters
+        ----------
+        prices : np.ndarray
+            Price tensor of shape (K, T, N).
+        weights : np.ndarray
+            Weights of shape (K, N), one row per window. Used as given
+            (no normalization).
+        method : {'cumprod', 'logsum'}, default='cumprod'
+            How cumulative ETF returns are accumulated, as in `fit`.
+
+        Returns
+        -------
+        returns : np.ndarray
+            Asset returns of shape (K, T-1, N).
+        etf_returns : np.ndarray
+            ETF returns of shape (K, T-1).
+        etf_cumulative_returns : np.ndarray
+            Cumulative ETF value series of shape (K, T-1).
+        """
+        log_space = _log_space(method)
+        if not isinstance(prices, np.ndarray) or not isinstance(weights, np.ndarray):
+            raise ValueError("Prices and weights must be NumPy ndarrays")
+        if prices.ndim != 3 or weights.shape != (prices.shape[0], prices.shape[2]):
+            raise ValueError("Prices must have shape (K, T, N) and weights shape (K, N)")
+
+        returns = ETFTrick._simple_returns(prices)
+        weights = weights.astype(np.result_type(returns.dtype, weights.dtype), copy=False)
+        etf_returns = np.einsum('ktn,kn->kt', returns, weights, optimize=True)
+        etf_cumulative_returns = ETFTrick._accumulate(etf_returns, log_space, axis=1)
+        return returns, etf_returns, etf_cumulative_returns
+
+    @staticmethod
+    def _simple_returns(prices):
+        """
+        Simple returns along the time axis (second to last) in a single new
+        buffer, laid out like `prices` (DataFrame values are column-major)
+        so the ETF matmul sums in the same order as before; returns over a
+        zero previous price are NaN.
+        """
+        dtype = _float_dtype(prices)
+        # object input (e.g. a mixed-dtype DataFrame) cannot go through the ufunc loops
+        prices = np.asarray(prices, dtype=dtype)
+        p1, p0 = prices[..., 1:, :], prices[..., :-1, :]
+        if _use_numexpr(p1):
+            returns = np.empty_like(p1, dtype=dtype)
+            ne.evaluate("where(p0 != 0, p1 / p0 - 1, nan)",
+                        local_dict={'p1': p1, 'p0': p0, 'nan': dtype.type(np.nan)},
+                        out=returns, casting='same_kind')
+        else:
+            # masked divide: lanes with a zero previous price keep the NaN fill
+            returns = np.full_like(p1, np.nan, dtype=dtype)
+            np.divide(p1, p0, out=returns, where=(p0 != 0))
+            np.subtract(returns, 1.0, out=returns)
+        return returns
+
+    @staticmethod
+    def _accumulate(returns, log_space, axis=0):
+        """Cumulative growth of `returns` along `axis` in a single new buffer."""
+        fused = _use_numexpr(returns)
+        if log_space:
+            # a price falling to zero gives log1p(-1) = -inf, i.e. zero growth
+            with np.errstate(divide='ignore'):
+                out = ne.evaluate("log1p(r)", local_dict={'r': returns}) if fused else np.log1p(returns)
+            np.cumsum(out, axis=axis, out=out)
+            np.exp(out, out=out)
         else:
-            self._cumulative_returns = np.cumprod(self._returns + 1, axis=0)
-        self._etf_returns = self._returns @ self._weights
-        self._etf_cumulative_returns = np.cumprod(self._etf_returns+1)
+            out = ne.evaluate("r + 1", local_dict={'r': returns}) if fused else returns + 1.0
+            np.cumprod(out, axis=axis, out=out)
+        return out
         
 
     @property
@@ -46,6 +46,7 @@ class TimeSeriesEmbargoCV(BaseCrossValidator):
             raise ValueError("'embargo_size' must be int")
         self.n_splits = cv
         self.embargo_size = embargo_size
+        self._layout_cache = {}
 
     def get_n_splits(self, X=None, y=None, groups=None):
         """
@@ -67,10 +68,30 @@ class TimeSeriesEmbargoCV(BaseCrossValidator):
         n_splits : int
             Number of folds/splits.
         """
-        n_samples = len(X)
-        fold_size = int(n_samples / self.n_splits)
-        n_possible_splits = (n_samples - self.embargo_size) // fold_size
-        return min(self.n_splits, n_possible_splits)
+        _, n_actual_splits = self._compute_layout(len(X))
+        return n_actual_splits
+
+    def _compute_layout(self, n_samples):
+        """
+        Integer fold layout for `n_samples` samples, memoized per
+        ``(n_samples, n_splits, embargo_size)`` across calls.
+
+        Returns
+        -------
+        fold_size : int
+            Number of samples in each fold.
+
+        n_actual_splits : int
+            Number of folds that fit once the embargo is accounted for.
+        """
+        key = (n_samples, self.n_splits, self.embargo_size)
+        layout = self._layout_cache.get(key)
+        if layout is None:
+            fold_size = n_samples // self.n_splits
+            n_possible_splits = (n_samples - self.embargo_size) // fold_size
+            layout = fold_size, min(self.n_splits, n_possible_splits)
+            self._layout_cache[key] = layout
+        return layout
 
     def split(self, X=None, y=None, groups=None):
         """
@@ -94,10 +115,43 @@ class TimeSeriesEmbargoCV(BaseCrossValidator):
 
         test_indices : ndarray
             The testing set indices for that split.
+
+        Notes
+        -----
+        The yielded arrays are read-only views into one shared
+        ``np.arange(n_samples)``; copy them before modifying in place.
+        """
+        all_indices = np.arange(len(X))
+        # folds overlap in the shared buffer, so in-place edits must raise
+        all_indices.flags.writeable = False
+        for train_slice, test_slice in self.split_slices(X):
+            yield all_indices[train_slice], all_indices[test_slice]
+
+    def split_slices(self, X=None, y=None, groups=None):
+        """
+        Generate train/test folds as slices, without allocating index arrays.
+
+        Parameters
+        ----------
+        X : array-like, shape (n_samples, ...)
+            The data to split.
+
+        y : array-like, shape (n_samples, ...)
+            Always ignored, exists for compatibility.
+
+        groups : array-like, with shape (n_samples,), optional
+            Always ignored, exists for compatibility.
+
+        Yields
+        ------
+        train_slice : slice
+            The training set positions for that split.
+
+        test_slice : slice
+            The testing set positions for that split.
         """
         n_samples = len(X)
-        fold_size = int(n_samples / self.n_splits)
-        n_actual_splits = self.get_n_splits(X)
+        fold_size, n_actual_splits = self._compute_layout(n_samples)
         for i in range(n_actual_splits):
             train_start_idx = i * fold_size
             train_end_idx = i * fold_size + fold_size
@@ -105,6 +159,4 @@ class TimeSeriesEmbargoCV(BaseCrossValidator):
             test_end_idx = test_start_idx + fold_size - self.embargo_size
             if test_end_idx > n_samples:
                 break
-            train_indices = np.arange(train_start_idx, train_end_idx)
-            test_indices = np.arange(test_start_idx, test_end_idx)
-            yield train_indices, test_indices
\ No newline at end of file
+            yield slice(train_start_idx, train_end_idx), slice(test_start_idx, test_end_idx)
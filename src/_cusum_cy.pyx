@@ -0,0 +1,38 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Cython build of the CUSUM event scan, used by `CumSumFilter` when Numba is
+not installed. Build it with ``python build_cython.py build_ext --inplace``.
+"""
+import numpy as np
+cimport numpy as cnp
+
+
+def cusum_filter(const double[::1] data, double h):
+    """
+    Sequential CUSUM scan over a contiguous float64 array.
+
+    Returns the integer positions at which either cumulative sum crosses `h`.
+    """
+    cdef Py_ssize_t n = data.shape[0]
+    cdef cnp.int64_t[::1] out = np.empty(n, dtype=np.int64)
+    cdef Py_ssize_t i, k = 0
+    cdef double s_plus = 0.0, s_minus = 0.0, v
+    cdef int trig
+
+    for i in range(n):
+        v = data[i]
+        # same branch-free update as the Numba kernel: selects for the clamps
+        # (NaN-safe), the trigger mask for the cursor and the reset
+        s_plus = s_plus + v
+        s_plus = s_plus if s_plus > 0.0 else 0.0
+        s_minus = s_minus + v
+        s_minus = s_minus if s_minus < 0.0 else 0.0
+
+        trig = (s_plus >= h) | (s_minus <= -h)
+        out[k] = i
+        k += trig
+        s_plus *= 1 - trig
+        s_minus *= 1 - trig
+
+    # copy so the n-length scratch buffer is not kept alive by the result
+    return np.asarray(out)[:k].copy()
@@ -0,0 +1,117 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+import CumSumFilter as cusum_module
+from CumSumFilter import CumSumFilter
+
+
+def sequential_cusum(data, h):
+    """Reference scan: the original per-sample loop."""
+    s_plus, s_minus = 0, 0
+    events = []
+    for i, v in enumerate(data):
+        s_plus = max(0, s_plus + v)
+        s_minus = min(0, s_minus + v)
+        if s_plus >= h or abs(s_minus) >= h:
+            events.append(i)
+            s_plus, s_minus = 0, 0
+    return np.asarray(events, dtype=np.int64)
+
+
+def make_returns(n, sd=0.01, nan_every=None, seed=0):
+    x = np.random.default_rng(seed).standard_normal(n) * sd
+    if nan_every:
+        x[::nan_every] = np.nan
+    return x
+
+
+@pytest.mark.parametrize('h', [0.002, 0.01, 0.05, 0.5])
+@pytest.mark.parametrize('nan_every', [None, 37])
+@pytest.mark.parametrize('n', [0, 1, 10, 1000, 70000])
+def test_numpy_scan_matches_sequential(n, nan_every, h):
+    x = make_returns(n, nan_every=nan_every)
+    events = CumSumFilter(x, h)._filter_numpy()
+    assert events.dtype == np.int64
+    np.testing.assert_array_equal(events, sequential_cusum(x, h))
+
+
+@pytest.mark.parametrize('block_size, seq_window', [(7, 1), (16, 3), (64, 5), (1000, 8)])
+@pytest.mark.parametrize('h', [0.001, 0.02, 1.0])
+def test_numpy_scan_matches_sequential_across_blocks(monkeypatch, block_size, seq_window, h):
+    monkeypatch.setattr(cusum_module, '_BLOCK_SIZE', block_size)
+    monkeypatch.setattr(cusum_module, '_SEQ_WINDOW', seq_window)
+    for n in [block_size - 1, block_size, 5 * block_size + 3, 7001]:
+        x = make_returns(n, nan_every=41, seed=n)
+        np.testing.assert_array_equal(CumSumFilter(x, h)._filter_numpy(), sequential_cusum(x, h))
+
+
+def test_numpy_scan_exact_ties():
+    # -0.1 + 0.7 + 0.2 rounds below 0.9 sequentially but the closed form reaches it
+    x = np.array([-0.1, 0.7, 0.2])
+    assert sequential_cusum(x, 0.9).shape == (0,)
+    np.testing.assert_array_equal(CumSumFilter(x, 0.9)._filter_numpy(), [])
+
+
+@pytest.mark.parametrize('block_size, seq_window', [(65536, 256), (7, 1), (64, 5), (1000, 8)])
+def test_numpy_scan_matches_sequential_on_decimal_grids(monkeypatch, block_size, seq_window):
+    monkeypatch.setattr(cusum_module, '_BLOCK_SIZE', block_size)
+    monkeypatch.setattr(cusum_module, '_SEQ_WINDOW', seq_window)
+    rng = np.random.default_rng(block_size)
+    grid = [0.1, -0.1, 0.2, -0.2, 0.3, 0.05, -0.05]
+    cases = [
+        (np.round(rng.standard_normal(200_000) * 0.002, 3), 0.02),
+        (rng.choice(grid, size=20_000), 0.9),
+        (rng.choice(grid, size=20_000), 0.3),
+        (rng.choice(grid + [np.nan], size=20_000), 0.7),
+    ]
+    for x, h in cases:
+        np.testing.assert_array_equal(CumSumFilter(x, h)._filter_numpy(), sequential_cusum(x, h))
+
+
+def test_kernel_matches_sequential():
+    x = make_returns(20000, nan_every=53)
+    for h in [0.005, 0.05]:
+        np.testing.assert_array_equal(cusum_module._cusum_kernel(x, h), sequential_cusum(x, h))
+
+
+@pytest.mark.parametrize('n, nan_every', [(0, None), (1, None), (20000, None), (20000, 53)])
+@pytest.mark.parametrize('h', [0.005, 0.05, 0.5])
+def test_cython_kernel_matches_sequential(n, nan_every, h):
+    cusum_cy = pytest.importorskip('_cusum_cy')
+    x = make_returns(n, nan_every=nan_every, seed=n)
+    out = cusum_cy.cusum_filter(x, h)
+    assert out.dtype == np.int64
+    np.testing.assert_array_equal(out, sequential_cusum(x, h))
+
+
+def test_cython_kernel_exact_ties():
+    cusum_cy = pytest.importorskip('_cusum_cy')
+    rng = np.random.default_rng(0)
+    x = rng.choice([0.1, -0.1, 0.2, -0.2, 0.3, 0.05, -0.05], size=20000)
+    for h in [0.3, 0.9]:
+        np.testing.assert_array_equal(cusum_cy.cusum_filter(x, h), sequential_cusum(x, h))
+    np.testing.assert_array_equal(cusum_cy.cusum_filter(np.array([-0.1, 0.7, 0.2]), 0.9), [])
+
+
+def test_filter_outputs():
+    x = make_returns(500, nan_every=97)
+    series = pd.Series(x, index=pd.date_range('2020-01-01', periods=500))
+    f = CumSumFilter(series, 0.02)
+    events = f.filter()
+    expected = sequential_cusum(x, 0.02)
+    np.testing.assert_array_equal(events, expected)
+    np.testing.assert_array_equal(f.events_index, expected)
+    np.testing.assert_array_equal(f.filtered_events, x[expected])
+    assert f.index.equals(series.index)
+
+
+@pytest.mark.parametrize('bad', [None, 5.0, {'a': 1}, ['x', 'y'], np.zeros((4, 2)), np.zeros((2, 2, 2))])
+def test_invalid_input_raises_value_error(bad):
+    with pytest.raises(ValueError, match='^log.returns must'):
+        CumSumFilter(bad, 0.1)
@@ -0,0 +1,207 @@
+import subprocess
+import sys
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+SRC = Path(__file__).resolve().parents[1] / 'src'
+sys.path.insert(0, str(SRC))
+
+import ETFTrick as etf_module
+from ETFTrick import ETFTrick
+
+
+def reference_fit(prices, weights):
+    """Reference: the original formulas (pandas cumprod for DataFrame input)."""
+    values = np.asarray(prices)
+    returns = values[1:] / values[:-1] - 1
+    if isinstance(prices, pd.DataFrame):
+        cumulative_returns = (pd.DataFrame(returns) + 1).cumprod().values
+    else:
+        cumulative_returns = np.cumprod(returns + 1, axis=0)
+    etf_returns = returns @ weights
+    return returns, cumulative_returns, etf_returns, np.cumprod(etf_returns + 1)
+
+
+def make_prices(t, n, seed=0):
+    rng = np.random.default_rng(seed)
+    prices = 100 * np.cumprod(1 + rng.standard_normal((t, n)) * 0.01, axis=0)
+    return prices, rng.dirichlet(np.ones(n))
+
+
+def fitted(model):
+    return model.returns, model.cumulative_returns, model.etf_returns, model.etf_cumulative_returns
+
+
+@pytest.fixture(params=['numba', 'numpy', 'numexpr'])
+def path(request, monkeypatch):
+    """Force one code path of `fit`; the fixture value tells if it is bit-exact."""
+    if request.param == 'numba':
+        if not etf_module._HAS_NUMBA:
+            pytest.skip('numba not installed')
+        return False
+    monkeypatch.setattr(etf_module, '_HAS_NUMBA', False)
+    if request.param == 'numexpr':
+        if not etf_module._HAS_NUMEXPR:
+            pytest.skip('numexpr not installed')
+        monkeypatch.setattr(etf_module, '_NUMEXPR_MIN_SIZE', 0)
+    else:
+        monkeypatch.setattr(etf_module, '_HAS_NUMEXPR', False)
+    return True
+
+
+def assert_series_equal(got, expected, exact):
+    for g, e in zip(got, expected):
+        if exact:
+            np.testing.assert_array_equal(np.asarray(g), e)
+        else:
+            np.testing.assert_allclose(np.asarray(g), e, rtol=1e-12, atol=1e-15)
+
+
+def test_fit_matches_baseline(path):
+    prices, weights = make_prices(300, 5)
+    model = ETFTrick(prices, weights)
+    model.fit()
+    assert_series_equal(fitted(model), reference_fit(prices, weights), path)
+
+
+def test_fit_matches_baseline_above_numexpr_threshold(monkeypatch):
+    if not etf_module._HAS_NUMEXPR:
+        pytest.skip('numexpr not installed')
+    monkeypatch.setattr(etf_module, '_HAS_NUMBA', False)
+    prices, weights = make_prices(25_001, 4)
+    assert prices[1:].size >= etf_module._NUMEXPR_MIN_SIZE
+    model = ETFTrick(prices, weights)
+    model.fit()
+    assert_series_equal(fitted(model), reference_fit(prices, weights), True)
+
+
+def test_dataframe_keeps_cumulative_returns_past_missing_prices(path):
+    prices, weights = make_prices(200, 3, seed=1)
+    frame = pd.DataFrame(prices, columns=['a', 'b', 'c'],
+                         index=pd.date_range('2020-01-01', periods=200))
+    frame.iloc[[20, 21, 90], 1] = np.nan
+    model = ETFTrick(frame, pd.Series(weights, index=frame.columns))
+    model.fit()
+    expected = reference_fit(frame, weights)
+    assert_series_equal(fitted(model), expected, path)
+    assert isinstance(model.cumulative_returns, pd.DataFrame)
+    assert model.cumulative_returns.index.equals(frame.index[1:])
+    assert np.isnan(model.cumulative_returns['b'].iloc[20])
+    assert np.isfinite(model.cumulative_returns['b'].iloc[-1])
+
+
+def test_object_prices(path):
+    prices, weights = make_prices(50, 3, seed=6)
+    model = ETFTrick(pd.DataFrame(prices).astype(object), weights)
+    model.fit()
+    assert model.returns.values.dtype == np.float64
+    assert_series_equal(fitted(model), reference_fit(prices, weights), False)
+
+
+def test_zero_previous_price_gives_nan(path):
+    prices, weights = make_prices(50, 3, seed=7)
+    prices[10, 1] = 0.0
+    model = ETFTrick(prices, weights)
+    model.fit()
+    assert np.isnan(model.returns[10, 1])
+    assert np.isnan(model.etf_returns[10])
+    assert np.isnan(model.cumulative_returns[10:, 1]).all()
+    assert np.isfinite(model.cumulative_returns[:10]).all()
+
+
+def test_zero_previous_price_gives_nan_above_numexpr_threshold(monkeypatch):
+    if not etf_module._HAS_NUMEXPR:
+        pytest.skip('numexpr not installed')
+    monkeypatch.setattr(etf_module, '_HAS_NUMBA', False)
+    prices, weights = make_prices(25_001, 4, seed=8)
+    prices[[100, 20_000], [0, 3]] = 0.0
+    model = ETFTrick(prices, weights)
+    model.fit()
+    np.testing.assert_array_equal(np.argwhere(np.isnan(model.returns)), [[100, 0], [20_000, 3]])
+    assert np.isfinite(model.returns[99, 0])
+
+
+def test_logsum_method(path):
+    prices, weights = make_prices(300, 5, seed=2)
+    model = ETFTrick(prices, weights)
+    model.fit(method='logsum')
+    returns = prices[1:] / prices[:-1] - 1
+    np.testing.assert_allclose(model.cumulative_returns, np.exp(np.cumsum(np.log1p(returns), axis=0)), rtol=1e-12)
+    np.testing.assert_allclose(model.etf_cumulative_returns, np.exp(np.cumsum(np.log1p(returns @ weights))), rtol=1e-12)
+    with pytest.raises(ValueError):
+        model.fit(method='sum')
+
+
+def test_dtype_option(path):
+    prices, weights = make_prices(300, 5, seed=3)
+    model = ETFTrick(prices, weights, dtype=np.float32)
+    model.fit()
+    for got, expected in zip(fitted(model), reference_fit(prices, weights)):
+        assert got.dtype == np.float32
+        np.testing.assert_allclose(got, expected, rtol=1e-4, atol=1e-6)
+    with pytest.raises(ValueError):
+        ETFTrick(prices, weights, dtype=np.float16)
+
+
+def test_mixed_precision_etf_follows_weights(path):
+    prices, weights = make_prices(300, 5, seed=4)
+    model = ETFTrick(prices.astype(np.float32), weights)
+    model.fit()
+    assert model.returns.dtype == np.float32
+    assert model.etf_returns.dtype == np.float64
+    assert model.etf_cumulative_returns.dtype == np.float64
+
+
+@pytest.mark.parametrize('method', ['cumprod', 'logsum'])
+def test_fit_many_matches_separate_fits(method):
+    rng = np.random.default_rng(5)
+    prices = 100 * np.cumprod(1 + rng.standard_normal((4, 120, 6)) * 0.01, axis=1)
+    weights = rng.dirichlet(np.ones(6), size=4)
+    returns, etf_returns, etf_cumulative_returns = ETFTrick.fit_many(prices, weights, method=method)
+    for k in range(4):
+        model = ETFTrick(prices[k], weights[k], normalize_weights=False)
+        model.fit(method=method)
+        np.testing.assert_allclose(returns[k], model.returns, rtol=1e-12)
+        np.testing.assert_allclose(etf_returns[k], model.etf_returns, rtol=1e-12)
+        np.testing.assert_allclose(etf_cumulative_returns[k], model.etf_cumulative_returns, rtol=1e-12)
+
+
+@pytest.mark.parametrize('prices, weights', [
+    (np.ones((10, 3)), np.ones((1, 3))),
+    (np.ones((2, 10, 3)), np.ones((2, 4))),
+    (np.ones((2, 10, 3)), np.ones(3)),
+    (np.ones((2, 10, 3)).tolist(), np.ones((2, 3))),
+])
+def test_fit_many_rejects_bad_shapes(prices, weights):
+    with pytest.raises(ValueError):
+        ETFTrick.fit_many(prices, weights)
+
+
+def test_normalization_warning_skipped_when_ignored(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('warning message formatted although ignored')
+
+    monkeypatch.setattr(np, 'array2string', fail)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        ETFTrick(np.ones((3, 2)), np.array([1.0, 3.0]))
+
+
+def test_normalization_warning_shown_by_default():
+    with pytest.warns(UserWarning, match='Weights normalized'):
+        ETFTrick(np.ones((3, 2)), np.array([1.0, 3.0]))
+
+
+def test_ignore_option_seen_past_numpy_message_filters():
+    # `-W ignore::UserWarning` sits behind the message filters NumPy adds at import
+    code = (
+        f"import sys; sys.path.insert(0, {str(SRC)!r}); "
+        "import numpy, ETFTrick; "
+        "sys.exit(0 if ETFTrick._warning_ignored(UserWarning) else 1)"
+    )
+    result = subprocess.run([sys.executable, '-W', 'ignore::UserWarning', '-c', code])
+    assert result.returncode == 0
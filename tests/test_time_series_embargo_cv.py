@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip('sklearn')
+from sklearn.linear_model import Ridge
+from sklearn.model_selection import GridSearchCV, cross_val_score
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from TimeSeriesEmbargoCV import TimeSeriesEmbargoCV
+
+
+def reference_folds(n_samples, n_splits, embargo_size):
+    """Fold layout of the original implementation."""
+    fold_size = int(n_samples / n_splits)
+    n_actual_splits = min(n_splits, (n_samples - embargo_size) // fold_size)
+    folds = []
+    for i in range(n_actual_splits):
+        train_start = i * fold_size
+        train_end = train_start + fold_size
+        test_start = train_end + embargo_size
+        test_end = test_start + fold_size - embargo_size
+        if test_end > n_samples:
+            break
+        folds.append((np.arange(train_start, train_end), np.arange(test_start, test_end)))
+    return n_actual_splits, folds
+
+
+@pytest.mark.parametrize('n_samples', [10, 100, 1001, 12345])
+@pytest.mark.parametrize('n_splits', [1, 2, 5, 7])
+@pytest.mark.parametrize('embargo_size', [0, 1, 3, 20])
+def test_split_matches_reference_layout(n_samples, n_splits, embargo_size):
+    X = np.zeros((n_samples, 2))
+    cv = TimeSeriesEmbargoCV(cv=n_splits, embargo_size=embargo_size)
+    n_actual_splits, expected = reference_folds(n_samples, n_splits, embargo_size)
+
+    assert cv.get_n_splits(X) == n_actual_splits
+    for _ in range(2):  # second pass goes through the cached layout
+        folds = list(cv.split(X))
+        assert len(folds) == len(expected)
+        for (train, test), (exp_train, exp_test) in zip(folds, expected):
+            np.testing.assert_array_equal(train, exp_train)
+            np.testing.assert_array_equal(test, exp_test)
+
+    all_indices = np.arange(n_samples)
+    slices = list(cv.split_slices(X))
+    assert len(slices) == len(expected)
+    for (train, test), (exp_train, exp_test) in zip(slices, expected):
+        assert isinstance(train, slice) and isinstance(test, slice)
+        np.testing.assert_array_equal(all_indices[train], exp_train)
+        np.testing.assert_array_equal(all_indices[test], exp_test)
+
+
+def test_layout_follows_parameter_changes():
+    X = np.zeros(500)
+    cv = TimeSeriesEmbargoCV(cv=5, embargo_size=10)
+    assert cv.get_n_splits(X) == 4
+    cv.n_splits = 4
+    assert cv.get_n_splits(X) == reference_folds(500, 4, 10)[0]
+
+
+def test_split_indices_are_read_only():
+    cv = TimeSeriesEmbargoCV(cv=5, embargo_size=3)
+    train, test = next(cv.split(np.zeros(100)))
+    with pytest.raises(ValueError):
+        train[0] = -1
+    with pytest.raises(ValueError):
+        test += 1
+
+
+def test_usable_with_sklearn_model_selection():
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((500, 3))
+    y = X @ np.array([1.0, 2.0, 3.0]) + rng.standard_normal(500) * 0.1
+    cv = TimeSeriesEmbargoCV(cv=5, embargo_size=10)
+
+    scores = cross_val_score(Ridge(), X, y, cv=cv)
+    assert len(scores) == cv.get_n_splits(X)
+
+    search = GridSearchCV(Ridge(), {'alpha': [0.1, 1.0, 10.0]}, cv=cv).fit(X, y)
+    assert search.n_splits_ == cv.get_n_splits(X)
+    assert search.best_params_['alpha'] in (0.1, 1.0, 10.0)